@@ -1,56 +1,16 @@
-import argparse
-import mpi4py
-import matplotlib.pyplot as plt
+"""Thin wrapper around ``velo mpi``; see ``velo mpi --help`` for the options.
 
-from model import State, run_simulation
+All logic lives in the ``velo`` package so that this script only imports
+what the chosen options need.
+"""
 
+import sys
+from pathlib import Path
 
-def parse_args():
-    """Parse command line arguments for parallel parameter sweep.
-
-    Returns:
-        Parsed arguments containing:
-        - params: Path to CSV file with parameter combinations
-        - out_dir: Output directory for results
-        - workers: Number of worker processes ('auto' for automatic detection)
-        - plot: Boolean flag to generate plots after run
-
-    Note:
-        Use argparse.ArgumentParser to define all required and optional arguments
-    """
-    # TODO: Implement argument parsing
-    pass
-
-
-def main():
-    """Main function to run parallel parameter sweep using MPI.
-
-    This function should:
-    1. Parse command line arguments
-    2. Read parameter combinations from CSV file
-    3. Set up parallel processing with appropriate number of workers
-    4. Submit simulation jobs to worker processes
-    5. Collect results as they complete
-    6. Aggregate and save results
-    7. Optionally generate plots
-
-    Expected parameter CSV columns:
-    - steps: Number of simulation steps
-    - p1: Probability Mailly->Moulin
-    - p2: Probability Moulin->Mailly
-    - init_mailly: Initial bikes at Mailly
-    - init_moulin: Initial bikes at Moulin
-    - seed: Random seed
-
-    Output files:
-    - metrics.csv: Aggregated metrics for all runs
-    - Optional plots: PNG files for timeseries and metrics visualization
-
-    Note:
-        - Use the mpi4py module for parallel processing
-    """
-    pass
+# Allow running from a checkout without ``pip install -e .``.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from velo.cli import main  # noqa: E402
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(["mpi", *sys.argv[1:]]))
@@ -0,0 +1,8 @@
+"""Bike-sharing simulation between the Mailly and Moulin stations.
+
+Nothing heavy is imported here: ``velo.cli`` must stay cheap to import so
+that short-lived cluster tasks do not pay for plotting or MPI libraries
+they never use.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,74 @@
+"""Command-line entry point: ``velo <command> [options]``.
+
+Only the module of the chosen subcommand is imported, after the command
+name is known. Subcommand modules import matplotlib and mpi4py inside the
+code paths that need them, so a cluster task running ``velo one`` loads
+numpy and the standard library and nothing else.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional
+
+# name -> (module, one-line help). Keep this free of imports.
+COMMANDS = {
+    "single": ("velo.commands.single", "Run one simulation and save its timeseries"),
+    "serial": ("velo.commands.serial", "Run a parameter sweep serially"),
+    "threads": ("velo.commands.threads", "Run a parameter sweep on a thread pool"),
+    "parallel": ("velo.commands.parallel", "Run a parameter sweep on a process pool"),
+    "mpi": ("velo.commands.mpi", "Run a parameter sweep over MPI ranks"),
+    "one": ("velo.commands.one", "Run one row of a parameter grid (Slurm array task)"),
+    "collect": ("velo.commands.collect", "Aggregate the outputs of 'velo one' runs"),
+    "check-imports": (
+        "velo.commands.check_imports",
+        "Fail if any command's cold start exceeds its import budget",
+    ),
+    "conformance": (
+        "velo.commands.conformance",
+        "Check engines and sweep backends against the reference model",
+    ),
+}
+
+
+def load_command(name: str) -> ModuleType:
+    """Import the module implementing subcommand ``name``."""
+    return importlib.import_module(COMMANDS[name][0])
+
+
+def subprocess_env() -> dict:
+    """Environment for child interpreters that must import this copy of velo.
+
+    Needed when velo runs from a checkout without being installed.
+    """
+    root = str(Path(__file__).resolve().parents[1])
+    pythonpath = os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))
+    return dict(os.environ, PYTHONPATH=pythonpath)
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, adding options for ``command`` only."""
+    parser = argparse.ArgumentParser(
+        prog="velo", description="Bike-sharing simulation between Mailly and Moulin."
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        if name == command:
+            load_command(name).add_arguments(subparser)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    parser = build_parser(command if command in COMMANDS else None)
+    args = parser.parse_args(argv)
+    return load_command(args.command).run(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
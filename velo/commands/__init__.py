@@ -0,0 +1,7 @@
+"""Subcommands of the ``velo`` CLI.
+
+Each module exposes ``add_arguments(parser)`` and ``run(args)``. Module-level
+imports must not load matplotlib or mpi4py; import them inside the code paths
+that need them. pandas is not used at all. ``velo check-imports`` enforces
+both rules.
+"""
@@ -0,0 +1,96 @@
+"""``velo check-imports``: guard the cold-start cost of every subcommand.
+
+Each subcommand is imported in a fresh interpreter, the way a Slurm task
+would start it. Absolute times vary from machine to machine, so the budget
+is relative: a command may take at most ``--margin-ms`` longer than a bare
+``import numpy``, which every simulation needs anyway. The check also fails
+when a command pulls in a module that must stay lazy.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from velo.cli import COMMANDS, subprocess_env
+
+# Must only be imported by the code paths that need them.
+LAZY_MODULES = ("matplotlib", "pandas", "mpi4py")
+
+PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+if sys.argv[1]:
+    import velo.cli
+    velo.cli.load_command(sys.argv[1])
+else:
+    importlib.import_module("numpy")
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (LAZY_MODULES,)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--margin-ms",
+        type=float,
+        default=50.0,
+        help=(
+            "Allowed import time per command over a bare 'import numpy',"
+            " in ms (default: 50)"
+        ),
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Fresh interpreters per measurement; the fastest counts (default: 5)",
+    )
+
+
+def probe(command: str) -> dict:
+    """Import ``command`` (numpy alone if empty) in a new interpreter.
+
+    Returns the import time and the lazy modules that got loaded.
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, command],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=subprocess_env(),
+    ).stdout
+    return json.loads(out)
+
+
+def best_of(command: str, repeat: int) -> dict:
+    """Fastest of ``repeat`` probes, with the lazy modules seen in any of them."""
+    results = [probe(command) for _ in range(max(repeat, 1))]
+    return {
+        "ms": min(r["seconds"] for r in results) * 1000,
+        "loaded": sorted({m for r in results for m in r["loaded"]}),
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    baseline_ms = best_of("", args.repeat)["ms"]
+    budget_ms = baseline_ms + args.margin_ms
+    print(f"import numpy: {baseline_ms:.1f} ms, budget per command: {budget_ms:.1f} ms")
+
+    failures = 0
+    print(f"{'command':<15} {'import ms':>10}  lazy modules loaded")
+    for command in COMMANDS:
+        result = best_of(command, args.repeat)
+        failed = result["ms"] > budget_ms or bool(result["loaded"])
+        failures += failed
+        status = "FAIL" if failed else "ok"
+        loaded = ", ".join(result["loaded"]) or "-"
+        print(f"{command:<15} {result['ms']:>10.1f}  {loaded}  {status}")
+
+    if failures:
+        print(
+            f"{failures} command(s) over the {budget_ms:.0f} ms budget"
+            " or importing lazy modules"
+        )
+        return 1
+    return 0
@@ -0,0 +1,81 @@
+"""``velo collect``: aggregate the per-row outputs written by ``velo one``."""
+
+import argparse
+import json
+from pathlib import Path
+
+from velo.io import read_columns, read_rows, write_rows
+
+STATIONS = ("mailly", "moulin")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--in-dir",
+        type=Path,
+        required=True,
+        help="Directory holding one numbered subdirectory per run",
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        required=True,
+        help="Output directory for aggregated results",
+    )
+    parser.add_argument(
+        "--plot", action="store_true", help="Plot all runs after collecting"
+    )
+    parser.add_argument(
+        "--smooth-window",
+        type=int,
+        default=1,
+        help="Moving-average window for plots (default: 1, no smoothing)",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    run_dirs = sorted(
+        (p for p in args.in_dir.iterdir() if p.is_dir() and p.name.isdigit()),
+        key=lambda p: int(p.name),
+    )
+
+    metrics_rows = []
+    tidy_rows = []
+    kept = {}
+    for run_dir in run_dirs:
+        run_id = int(run_dir.name)
+        metrics_path = run_dir / "metrics.csv"
+        if not metrics_path.exists():
+            print(f"Skipping {run_dir}: no metrics.csv")
+            continue
+
+        row = {"run_id": run_id}
+        metadata_path = run_dir / "metadata.json"
+        if metadata_path.exists():
+            metadata = json.loads(metadata_path.read_text())
+            row.update((f"param_{k}", v) for k, v in metadata.items())
+        for metrics in read_rows(metrics_path):
+            row.update(metrics)
+        metrics_rows.append(row)
+
+        timeseries_path = run_dir / "timeseries.csv"
+        if timeseries_path.exists():
+            columns = read_columns(timeseries_path)
+            for station in STATIONS:
+                tidy_rows.extend(
+                    {"run_id": run_id, "time": t, "station": station, "bikes": n}
+                    for t, n in zip(columns["time"], columns[station])
+                )
+            if args.plot:
+                kept[run_id] = columns
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    write_rows(args.out_dir / "metrics.csv", metrics_rows)
+    write_rows(args.out_dir / "timeseries.csv", tidy_rows)
+    if args.plot:
+        from velo.plotting import plot_runs
+
+        plot_runs(kept, args.out_dir / "metrics_3plot.png", args.smooth_window)
+
+    print(f"Collected {len(metrics_rows)} runs into {args.out_dir}")
+    return 0
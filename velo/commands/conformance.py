@@ -0,0 +1,54 @@
+"""``velo conformance``: check every engine and backend against the reference."""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--replicates",
+        type=int,
+        default=300,
+        help="Seeds per case in the statistical check (default: 300)",
+    )
+    parser.add_argument(
+        "--z",
+        type=float,
+        default=4.0,
+        help="Allowed |z| of a sample mean against its expectation (default: 4)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Workers for the threads and parallel backends (default: 2)",
+    )
+    parser.add_argument(
+        "--mpi-ranks",
+        type=int,
+        default=2,
+        help="Ranks for the mpi backend, skipped without mpirun (default: 2)",
+    )
+    parser.add_argument(
+        "--regenerate",
+        action="store_true",
+        help="Rewrite the golden file from the reference model and exit",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    # The harness pulls in multiprocessing, subprocess and every engine;
+    # keep ``velo conformance --help`` as cheap as the other commands.
+    from velo.conformance import GOLDEN_PATH, format_table, run_all, write_golden
+
+    if args.regenerate:
+        write_golden()
+        print(f"Wrote {GOLDEN_PATH}")
+        return 0
+
+    checks = run_all(args.replicates, args.z, args.workers, args.mpi_ranks)
+    print(format_table(checks))
+    failed = [c for c in checks if c.status == "FAIL"]
+    if failed:
+        print(f"{len(failed)} check(s) failed")
+        return 1
+    return 0
@@ -0,0 +1,45 @@
+"""``velo mpi``: spread the sweep over MPI ranks (``mpirun -n N velo mpi ...``)."""
+
+import argparse
+
+from velo.sweep import add_sweep_arguments, finish, load_runs, simulate, write_run
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    add_sweep_arguments(parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    try:
+        from mpi4py import MPI
+    except ImportError:
+        raise SystemExit("velo mpi needs mpi4py: pip install 'velo[mpi]'") from None
+
+    comm = MPI.COMM_WORLD
+    rank, size = comm.Get_rank(), comm.Get_size()
+    if rank == 0 and args.workers != "auto":
+        print(
+            f"Ignoring --workers={args.workers}:"
+            f" the MPI world size ({size}) sets the parallelism"
+        )
+
+    runs = load_runs(args.params) if rank == 0 else None
+    runs = comm.bcast(runs, root=0)
+    if rank == 0:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+    comm.Barrier()
+
+    rows = []
+    kept = {}
+    for run_params in runs[rank::size]:
+        result = simulate(run_params)
+        rows.append(write_run(args.out_dir, result))
+        if args.plot:
+            kept[run_params["run_id"]] = result[1]
+
+    gathered = comm.gather((rows, kept), root=0)
+    if rank == 0:
+        all_rows = [row for part, _ in gathered for row in part]
+        all_kept = {k: v for _, part in gathered for k, v in part.items()}
+        finish(args.out_dir, all_rows, args.plot, args.smooth_window, all_kept)
+    return 0
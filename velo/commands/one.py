@@ -0,0 +1,56 @@
+"""``velo one``: run a single row of the parameter grid (one Slurm array task)."""
+
+import argparse
+import json
+from pathlib import Path
+
+from velo.io import read_params, write_columns, write_rows
+from velo.model import run_simulation
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--params",
+        type=Path,
+        default=Path("params.csv"),
+        help="Parameter grid (default: params.csv)",
+    )
+    parser.add_argument(
+        "--row-index", type=int, required=True, help="Row of the grid to run, from 0"
+    )
+    parser.add_argument(
+        "--out-dir", type=Path, required=True, help="Results go to OUT_DIR/ROW_INDEX/"
+    )
+    parser.add_argument(
+        "--base-seed",
+        type=int,
+        default=0,
+        help="Seed is BASE_SEED + ROW_INDEX when the row has none (default: 0)",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    rows = read_params(args.params, base_seed=args.base_seed)
+    if not 0 <= args.row_index < len(rows):
+        raise SystemExit(
+            f"--row-index {args.row_index} out of range:"
+            f" {args.params} has {len(rows)} rows"
+        )
+    params = rows[args.row_index]
+
+    timeseries, metrics = run_simulation(
+        initial_mailly=params["init_mailly"],
+        initial_moulin=params["init_moulin"],
+        steps=params["steps"],
+        p1=params["p1"],
+        p2=params["p2"],
+        seed=params["seed"],
+    )
+
+    run_dir = args.out_dir / str(args.row_index)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    write_columns(run_dir / "timeseries.csv", timeseries)
+    write_rows(run_dir / "metrics.csv", [metrics])
+    metadata = dict(params, row_index=args.row_index, params_file=str(args.params))
+    (run_dir / "metadata.json").write_text(json.dumps(metadata, indent=2))
+    return 0
@@ -0,0 +1,27 @@
+"""``velo parallel``: spread the sweep over local processes."""
+
+import argparse
+import multiprocessing as mp
+
+from velo.sweep import (
+    add_sweep_arguments,
+    pipeline_depth,
+    resolve_workers,
+    run_pipelined,
+    run_sweep,
+)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    add_sweep_arguments(parser, pipeline=True)
+
+
+def run(args: argparse.Namespace) -> int:
+    workers = resolve_workers(args.workers)
+    max_pending = pipeline_depth(args, workers)
+    with mp.Pool(processes=workers) as pool:
+        if max_pending is None:
+            run_sweep(args, pool.imap_unordered)
+        else:
+            run_pipelined(args, pool.imap_unordered, max_pending)
+    return 0
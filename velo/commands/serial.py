@@ -0,0 +1,18 @@
+"""``velo serial``: run every parameter set one after the other."""
+
+import argparse
+
+from velo.sweep import add_sweep_arguments, pipeline_depth, run_pipelined, run_sweep
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    add_sweep_arguments(parser, workers=False, pipeline=True)
+
+
+def run(args: argparse.Namespace) -> int:
+    max_pending = pipeline_depth(args, workers=1)
+    if max_pending is None:
+        run_sweep(args, map)
+    else:
+        run_pipelined(args, map, max_pending)
+    return 0
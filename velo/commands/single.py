@@ -0,0 +1,56 @@
+"""``velo single``: one reproducible simulation, no parallelism."""
+
+import argparse
+from pathlib import Path
+
+from velo.io import write_columns, write_key_values
+from velo.model import run_simulation
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--steps", type=int, required=True, help="Number of simulation steps"
+    )
+    parser.add_argument(
+        "--p1", type=float, required=True, help="Probability of a Mailly -> Moulin trip"
+    )
+    parser.add_argument(
+        "--p2", type=float, required=True, help="Probability of a Moulin -> Mailly trip"
+    )
+    parser.add_argument(
+        "--init-mailly", type=int, required=True, help="Initial bikes at Mailly"
+    )
+    parser.add_argument(
+        "--init-moulin", type=int, required=True, help="Initial bikes at Moulin"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--out-csv", type=Path, required=True, help="Timeseries CSV path"
+    )
+    parser.add_argument(
+        "--plot", action="store_true", help="Save mailly.png next to the CSV"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    timeseries, metrics = run_simulation(
+        initial_mailly=args.init_mailly,
+        initial_moulin=args.init_moulin,
+        steps=args.steps,
+        p1=args.p1,
+        p2=args.p2,
+        seed=args.seed,
+    )
+
+    args.out_csv.parent.mkdir(parents=True, exist_ok=True)
+    write_columns(args.out_csv, timeseries)
+    metrics_path = args.out_csv.with_name(f"{args.out_csv.stem}_metrics.csv")
+    write_key_values(metrics_path, metrics)
+
+    if args.plot:
+        from velo.plotting import plot_timeseries
+
+        plot_timeseries(timeseries, args.out_csv.parent / "mailly.png")
+
+    print(f"Wrote {args.out_csv} and {metrics_path}")
+    return 0
@@ -0,0 +1,20 @@
+"""``velo threads``: spread the sweep over threads of one process.
+
+The simulation loop holds the GIL, so this mostly illustrates why threads
+do not speed up CPU-bound Python code.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from velo.sweep import add_sweep_arguments, resolve_workers, run_sweep
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    add_sweep_arguments(parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    with ThreadPoolExecutor(max_workers=resolve_workers(args.workers)) as executor:
+        run_sweep(args, executor.map)
+    return 0
@@ -0,0 +1,488 @@
+"""Conformance of engines and sweep backends against the reference model.
+
+Two kinds of checks are run:
+
+- Golden: ``golden.json`` holds trajectories and final metrics produced by
+  ``velo.model`` for fixed seeds. The reference itself, the engines listed
+  in ``EXACT_ENGINES`` and every sweep backend in ``SWEEP_BACKENDS`` must
+  reproduce them exactly.
+- Statistical: engines that sample differently only have to agree in
+  distribution. For each case, the mean of every metric over many seeds
+  must lie within ``z`` standard errors of the exact expectation computed
+  by the ``analytic`` engine. The ``reference`` row of this check is what
+  validates the analytic engine itself.
+
+The pipelined sweep (``velo.sweep.run_pipelined``) is also checked for
+backpressure and for raising writer and simulation errors without hanging.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import multiprocessing as mp
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from velo import sweep
+from velo.engines import ENGINES, EXACT_ENGINES
+from velo.io import read_columns, read_rows, write_rows
+from velo.model import run_simulation
+
+GOLDEN_PATH = Path(__file__).with_name("golden.json")
+
+# Short runs that hit both empty-station boundaries, plus a zero-step run.
+GOLDEN_CASES = [
+    {
+        "steps": 300,
+        "p1": 0.5,
+        "p2": 0.47,
+        "init_mailly": 10,
+        "init_moulin": 5,
+        "seed": 123,
+    },
+    {
+        "steps": 300,
+        "p1": 0.5,
+        "p2": 0.63,
+        "init_mailly": 10,
+        "init_moulin": 5,
+        "seed": 124,
+    },
+    {
+        "steps": 300,
+        "p1": 0.6,
+        "p2": 0.47,
+        "init_mailly": 10,
+        "init_moulin": 2,
+        "seed": 125,
+    },
+    {"steps": 300, "p1": 0.9, "p2": 0.1, "init_mailly": 3, "init_moulin": 3, "seed": 7},
+    {"steps": 0, "p1": 0.5, "p2": 0.5, "init_mailly": 1, "init_moulin": 1, "seed": 0},
+]
+
+# Seed-free parameter sets for the statistical check.
+STAT_CASES = [
+    {"steps": 200, "p1": 0.3, "p2": 0.25, "init_mailly": 4, "init_moulin": 3},
+    {"steps": 200, "p1": 0.05, "p2": 0.04, "init_mailly": 2, "init_moulin": 2},
+    {"steps": 200, "p1": 0.6, "p2": 0.4, "init_mailly": 1, "init_moulin": 5},
+]
+STAT_METRICS = ("mailly", "unmet_mailly", "unmet_moulin")
+STAT_BASE_SEED = 10_000
+
+GOLDEN_COLUMNS = ("mailly", "unmet_mailly", "unmet_moulin")
+# Sweep commands, with any extra options, checked end to end.
+SWEEP_BACKENDS = (
+    "serial",
+    "serial --pipeline",
+    "threads",
+    "parallel",
+    "parallel --pipeline",
+    "mpi",
+)
+
+# Pipelined sweeps that take longer than this are reported as hung.
+PIPELINE_TIMEOUT = 30.0
+PIPELINE_RUNS = 24
+PIPELINE_MAX_PENDING = 3
+
+
+class Check(NamedTuple):
+    backend: str
+    check: str
+    cases: int
+    seconds: float
+    status: str  # "ok", "FAIL" or "skipped"
+    detail: str = ""
+
+
+def make_golden() -> List[Dict]:
+    """Run the reference model on ``GOLDEN_CASES``."""
+    golden = []
+    for params in GOLDEN_CASES:
+        timeseries, metrics = run_simulation(
+            initial_mailly=params["init_mailly"],
+            initial_moulin=params["init_moulin"],
+            steps=params["steps"],
+            p1=params["p1"],
+            p2=params["p2"],
+            seed=params["seed"],
+        )
+        golden.append(
+            {
+                "params": params,
+                "metrics": metrics,
+                "timeseries": {name: timeseries[name] for name in GOLDEN_COLUMNS},
+            }
+        )
+    return golden
+
+
+def write_golden(path: Path = GOLDEN_PATH) -> None:
+    """Regenerate the golden file, one case per line to keep diffs readable."""
+    cases = make_golden()
+    path.write_text("[\n" + ",\n".join(json.dumps(case) for case in cases) + "\n]\n")
+
+
+def load_golden(path: Path = GOLDEN_PATH) -> List[Dict]:
+    return json.loads(path.read_text())
+
+
+def _timed(backend: str, check: str, cases: int, func) -> Check:
+    start = time.perf_counter()
+    try:
+        mismatches = func()
+    except Exception as exc:  # report, keep checking the other backends
+        return Check(
+            backend,
+            check,
+            cases,
+            time.perf_counter() - start,
+            "FAIL",
+            f"{type(exc).__name__}: {exc}",
+        )
+    seconds = time.perf_counter() - start
+    if mismatches is None:
+        return Check(backend, check, cases, seconds, "skipped", "not available here")
+    if mismatches:
+        return Check(backend, check, cases, seconds, "FAIL", "; ".join(mismatches[:3]))
+    return Check(backend, check, cases, seconds, "ok")
+
+
+def _compare_metrics(label: str, expected: Dict, actual: Dict) -> List[str]:
+    return [
+        f"{label} {name}: expected {value}, got {actual.get(name)}"
+        for name, value in expected.items()
+        if actual.get(name) is None or float(actual[name]) != value
+    ]
+
+
+def check_reference_trajectories(golden: List[Dict]) -> Check:
+    def run():
+        mismatches = []
+        for index, case in enumerate(golden):
+            p = case["params"]
+            timeseries, metrics = run_simulation(
+                p["init_mailly"],
+                p["init_moulin"],
+                p["steps"],
+                p["p1"],
+                p["p2"],
+                p["seed"],
+            )
+            for name, expected in case["timeseries"].items():
+                if timeseries[name] != expected:
+                    first = next(
+                        (
+                            t
+                            for t, (a, b) in enumerate(zip(timeseries[name], expected))
+                            if a != b
+                        ),
+                        None,
+                    )
+                    mismatches.append(f"case {index} {name} diverges at t={first}")
+            mismatches += _compare_metrics(f"case {index}", case["metrics"], metrics)
+        return mismatches
+
+    return _timed("reference", "golden trajectories", len(golden), run)
+
+
+def check_engine_golden(name: str, golden: List[Dict]) -> Check:
+    def run():
+        results = ENGINES[name]([case["params"] for case in golden])
+        mismatches = []
+        for index, (case, metrics) in enumerate(zip(golden, results)):
+            mismatches += _compare_metrics(f"case {index}", case["metrics"], metrics)
+        return mismatches
+
+    return _timed(name, "golden metrics", len(golden), run)
+
+
+@contextlib.contextmanager
+def _quiet():
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _mpi_available() -> bool:
+    return (
+        shutil.which("mpirun") is not None
+        and importlib.util.find_spec("mpi4py") is not None
+    )
+
+
+def check_sweep_golden(
+    backend: str, golden: List[Dict], workers: int = 2, mpi_ranks: int = 2
+) -> Check:
+    """Run a sweep command end to end on the golden cases and compare its files."""
+    from velo.cli import main, subprocess_env
+
+    command, *options = backend.split()
+
+    def run():
+        if command == "mpi" and not _mpi_available():
+            return None
+        with tempfile.TemporaryDirectory() as tmp:
+            params_path = Path(tmp) / "params.csv"
+            out_dir = Path(tmp) / "out"
+            write_rows(params_path, [case["params"] for case in golden])
+            args = ["--params", str(params_path), "--out-dir", str(out_dir), *options]
+            if command != "serial":
+                args += ["--workers", str(workers)]
+            if command == "mpi":
+                subprocess.run(
+                    [
+                        "mpirun",
+                        "-n",
+                        str(mpi_ranks),
+                        sys.executable,
+                        "-m",
+                        "velo",
+                        "mpi",
+                        *args,
+                    ],
+                    check=True,
+                    capture_output=True,
+                    env=subprocess_env(),
+                )
+            else:
+                with _quiet():
+                    main([command, *args])
+
+            rows = {
+                int(row["run_id"]): row for row in read_rows(out_dir / "metrics.csv")
+            }
+            mismatches = []
+            for run_id, case in enumerate(golden):
+                if run_id not in rows:
+                    mismatches.append(f"run {run_id} missing from metrics.csv")
+                    continue
+                mismatches += _compare_metrics(
+                    f"run {run_id}", case["metrics"], rows[run_id]
+                )
+                columns = read_columns(out_dir / f"timeseries_{run_id}.csv")
+                for name, expected in case["timeseries"].items():
+                    if [int(v) for v in columns[name]] != expected:
+                        mismatches.append(f"run {run_id} timeseries {name} differs")
+            return mismatches
+
+    return _timed(backend, "golden sweep output", len(golden), run)
+
+
+def check_engine_statistics(name: str, replicates: int, z_max: float) -> Check:
+    """Compare an engine's sample means to the analytic expectation."""
+    worst = {"z": 0.0}
+
+    def run():
+        mismatches = []
+        expectations = ENGINES["analytic"](STAT_CASES)
+        for index, (case, expected) in enumerate(zip(STAT_CASES, expectations)):
+            runs = [dict(case, seed=STAT_BASE_SEED + i) for i in range(replicates)]
+            samples = ENGINES[name](runs)
+            for metric in STAT_METRICS:
+                values = np.array([s[metric] for s in samples], dtype=float)
+                diff = values.mean() - expected[metric]
+                se = values.std(ddof=1) / np.sqrt(replicates) if replicates > 1 else 0.0
+                z = abs(diff) / se if se > 0 else (0.0 if abs(diff) < 1e-9 else np.inf)
+                worst["z"] = max(worst["z"], z)
+                if z > z_max:
+                    mismatches.append(
+                        f"case {index} {metric}: mean {values.mean():.3f}"
+                        f" vs expected {expected[metric]:.3f} (|z|={z:.1f})"
+                    )
+        return mismatches
+
+    check = _timed(name, f"statistical, {replicates} seeds", len(STAT_CASES), run)
+    if check.status == "ok":
+        check = check._replace(detail=f"max |z| = {worst['z']:.2f}")
+    return check
+
+
+def _run_pipelined_within(
+    args: argparse.Namespace,
+    mapper,
+    max_pending: int,
+    write: sweep.Writer = sweep.write_run,
+) -> Optional[BaseException]:
+    """Run ``run_pipelined`` on a daemon thread; return the error it raised.
+
+    Raises ``TimeoutError`` if it has not returned after ``PIPELINE_TIMEOUT``.
+    """
+    outcome: List[Optional[BaseException]] = []
+
+    def target():
+        try:
+            with _quiet():
+                sweep.run_pipelined(args, mapper, max_pending, write)
+            outcome.append(None)
+        except BaseException as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(PIPELINE_TIMEOUT)
+    if thread.is_alive():
+        raise TimeoutError(f"still running after {PIPELINE_TIMEOUT:.0f} s")
+    return outcome[0]
+
+
+def _pipeline_args(tmp: str, seeds: List[int]) -> argparse.Namespace:
+    params_path = Path(tmp) / "params.csv"
+    write_rows(
+        params_path,
+        [
+            {
+                "steps": 50,
+                "p1": 0.5,
+                "p2": 0.5,
+                "init_mailly": 3,
+                "init_moulin": 3,
+                "seed": seed,
+            }
+            for seed in seeds
+        ],
+    )
+    return argparse.Namespace(
+        params=params_path, out_dir=Path(tmp) / "out", plot=False, smooth_window=1
+    )
+
+
+def check_pipeline_backpressure(workers: int = 2) -> Check:
+    """Runs handed to the pool but not yet written never exceed ``max_pending``."""
+    counts = {"fed": 0, "written": 0, "peak": 0}
+
+    def slow_write_run(out_dir, result):
+        time.sleep(0.005)  # let the simulations run ahead of the writer
+        row = sweep.write_run(out_dir, result)
+        counts["written"] += 1
+        return row
+
+    def counted(runs):
+        for run in runs:
+            counts["fed"] += 1
+            counts["peak"] = max(counts["peak"], counts["fed"] - counts["written"])
+            yield run
+
+    def run():
+        with tempfile.TemporaryDirectory() as tmp, mp.Pool(workers) as pool:
+            args = _pipeline_args(tmp, list(range(PIPELINE_RUNS)))
+            error = _run_pipelined_within(
+                args,
+                lambda func, runs: pool.imap_unordered(func, counted(runs)),
+                PIPELINE_MAX_PENDING,
+                write=slow_write_run,
+            )
+            if error is not None:
+                return [f"{type(error).__name__}: {error}"]
+            mismatches = []
+            if counts["peak"] > PIPELINE_MAX_PENDING:
+                mismatches.append(
+                    f"{counts['peak']} runs pending,"
+                    f" max_pending is {PIPELINE_MAX_PENDING}"
+                )
+            if counts["written"] != PIPELINE_RUNS:
+                mismatches.append(f"wrote {counts['written']} of {PIPELINE_RUNS} runs")
+            return mismatches
+
+    check = _timed("pipeline", "backpressure", PIPELINE_RUNS, run)
+    if check.status == "ok":
+        check = check._replace(
+            detail=f"peak pending {counts['peak']} <= {PIPELINE_MAX_PENDING}"
+        )
+    return check
+
+
+def check_pipeline_writer_error() -> Check:
+    """A failing write is raised by ``run_pipelined`` instead of being lost."""
+
+    def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            args = _pipeline_args(tmp, list(range(PIPELINE_RUNS)))
+            # A directory where a timeseries file should go makes that write fail.
+            (args.out_dir / "timeseries_5.csv").mkdir(parents=True)
+            error = _run_pipelined_within(args, map, PIPELINE_MAX_PENDING)
+            if not isinstance(error, OSError):
+                return [f"expected OSError, got {error!r}"]
+            return []
+
+    return _timed("pipeline", "writer error raised", PIPELINE_RUNS, run)
+
+
+def check_pipeline_simulation_error(workers: int = 2) -> Check:
+    """A simulation failing in a pool worker is raised and the pool shuts down."""
+
+    def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            # A negative seed makes numpy's generator raise in the worker. With
+            # the first run failing and max_pending=1, the feeder is always
+            # blocked on the run no one will write when the error arrives.
+            seeds = [-1] + list(range(1, PIPELINE_RUNS))
+            args = _pipeline_args(tmp, seeds)
+            outcome: List[Optional[BaseException]] = []
+
+            def in_pool():
+                with mp.Pool(workers) as pool:
+                    outcome.append(_run_pipelined_within(args, pool.imap_unordered, 1))
+
+            # Leaving the pool joins its task-feeder thread, which deadlocks
+            # if that thread is left blocked on the pending semaphore.
+            thread = threading.Thread(target=in_pool, daemon=True)
+            thread.start()
+            thread.join(PIPELINE_TIMEOUT)
+            if thread.is_alive():
+                return [f"pool did not shut down within {PIPELINE_TIMEOUT:.0f} s"]
+            if not outcome or not isinstance(outcome[0], ValueError):
+                return [f"expected ValueError, got {outcome[0] if outcome else None!r}"]
+            return []
+
+    return _timed("pipeline", "simulation error raised", PIPELINE_RUNS, run)
+
+
+def run_all(
+    replicates: int = 300,
+    z_max: float = 4.0,
+    workers: int = 2,
+    mpi_ranks: int = 2,
+    golden: Optional[List[Dict]] = None,
+) -> List[Check]:
+    golden = load_golden() if golden is None else golden
+    checks = [check_reference_trajectories(golden)]
+    checks += [check_engine_golden(name, golden) for name in EXACT_ENGINES]
+    checks += [
+        check_sweep_golden(backend, golden, workers, mpi_ranks)
+        for backend in SWEEP_BACKENDS
+    ]
+    checks += [
+        check_pipeline_backpressure(workers),
+        check_pipeline_writer_error(),
+        check_pipeline_simulation_error(workers),
+    ]
+    checks += [
+        check_engine_statistics(name, replicates, z_max)
+        for name in ENGINES
+        if name != "analytic"
+    ]
+    return checks
+
+
+def format_table(checks: List[Check]) -> str:
+    header = (
+        f"{'backend':<19} {'check':<24} {'cases':>5} {'seconds':>8}"
+        f"  {'result':<7} detail"
+    )
+    lines = [header, "-" * len(header)]
+    for c in checks:
+        lines.append(
+            f"{c.backend:<19} {c.check:<24} {c.cases:>5} {c.seconds:>8.3f}"
+            f"  {c.status:<7} {c.detail}"
+        )
+    return "\n".join(lines)
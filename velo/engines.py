@@ -0,0 +1,161 @@
+"""Alternative simulation engines, checked by ``velo conformance``.
+
+Every engine maps a list of parameter sets (as read by
+``velo.io.read_params``) to one dictionary of final metrics per set, with
+the same keys as the metrics returned by ``velo.model.run_simulation``.
+
+- ``reference``: ``velo.model.run_simulation``, the engine all others are
+  measured against.
+- ``batched``: steps all runs at once with numpy arrays. Each run still
+  draws from its own seeded generator in the reference order, so it must
+  match the reference draw for draw.
+- ``event``: jumps straight to the next step with a request using a
+  geometric draw. Cheaper when ``p1`` and ``p2`` are small, but consumes
+  random numbers differently, so it is only statistically equivalent.
+- ``analytic``: propagates the exact distribution of the Mailly count and
+  returns expected metrics. It ignores the seed.
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from velo.model import run_simulation
+
+Run = Dict[str, float]
+Metrics = Dict[str, float]
+Engine = Callable[[List[Run]], List[Metrics]]
+
+# Largest block of random draws the batched engine keeps in memory per run.
+BATCH_BLOCK_STEPS = 4096
+
+
+def _final_metrics(mailly, moulin, unmet_mailly, unmet_moulin) -> Metrics:
+    return {
+        "mailly": mailly,
+        "moulin": moulin,
+        "unmet_mailly": unmet_mailly,
+        "unmet_moulin": unmet_moulin,
+        "final_imbalance": mailly - moulin,
+    }
+
+
+def reference(runs: List[Run]) -> List[Metrics]:
+    return [
+        run_simulation(
+            initial_mailly=run["init_mailly"],
+            initial_moulin=run["init_moulin"],
+            steps=run["steps"],
+            p1=run["p1"],
+            p2=run["p2"],
+            seed=run["seed"],
+        )[1]
+        for run in runs
+    ]
+
+
+def batched(runs: List[Run]) -> List[Metrics]:
+    if not runs:
+        return []
+    rngs = [np.random.default_rng(run["seed"]) for run in runs]
+    steps = np.array([run["steps"] for run in runs])
+    p1 = np.array([run["p1"] for run in runs])
+    p2 = np.array([run["p2"] for run in runs])
+    mailly = np.array([run["init_mailly"] for run in runs])
+    moulin = np.array([run["init_moulin"] for run in runs])
+    unmet_mailly = np.zeros(len(runs), dtype=int)
+    unmet_moulin = np.zeros(len(runs), dtype=int)
+
+    for start in range(0, int(steps.max()), BATCH_BLOCK_STEPS):
+        block = min(BATCH_BLOCK_STEPS, int(steps.max()) - start)
+        # The reference draws (p1, p2) once per step; a run draws nothing
+        # once it has reached its own step count.
+        draws = np.zeros((len(runs), block, 2))
+        for i, rng in enumerate(rngs):
+            n = int(np.clip(steps[i] - start, 0, block))
+            draws[i, :n] = rng.random(2 * n).reshape(n, 2)
+        for t in range(block):
+            active = start + t < steps
+            want1 = active & (draws[:, t, 0] < p1)
+            move1 = want1 & (mailly > 0)
+            unmet_mailly += want1 & ~move1
+            mailly -= move1
+            moulin += move1
+            want2 = active & (draws[:, t, 1] < p2)
+            move2 = want2 & (moulin > 0)
+            unmet_moulin += want2 & ~move2
+            moulin -= move2
+            mailly += move2
+
+    return [
+        _final_metrics(int(a), int(b), int(c), int(d))
+        for a, b, c, d in zip(mailly, moulin, unmet_mailly, unmet_moulin)
+    ]
+
+
+def event_driven(runs: List[Run]) -> List[Metrics]:
+    results = []
+    for run in runs:
+        rng = np.random.default_rng(run["seed"])
+        p1, p2 = run["p1"], run["p2"]
+        mailly, moulin = run["init_mailly"], run["init_moulin"]
+        unmet_mailly = unmet_moulin = 0
+        busy = 1.0 - (1.0 - p1) * (1.0 - p2)  # P(at least one request in a step)
+        t = 0
+        while busy > 0:
+            t += int(rng.geometric(busy))
+            if t > run["steps"]:
+                break
+            # Which requests happened, given that at least one did: a
+            # Mailly request with probability p1 / busy, and without one
+            # the Moulin request is certain.
+            want1 = rng.random() * busy < p1
+            want2 = rng.random() < p2 if want1 else True
+            if want1:
+                if mailly > 0:
+                    mailly, moulin = mailly - 1, moulin + 1
+                else:
+                    unmet_mailly += 1
+            if want2:
+                if moulin > 0:
+                    moulin, mailly = moulin - 1, mailly + 1
+                else:
+                    unmet_moulin += 1
+        results.append(_final_metrics(mailly, moulin, unmet_mailly, unmet_moulin))
+    return results
+
+
+def analytic(runs: List[Run]) -> List[Metrics]:
+    results = []
+    for run in runs:
+        p1, p2 = run["p1"], run["p2"]
+        total = run["init_mailly"] + run["init_moulin"]
+        # dist[m] = P(mailly == m); the total number of bikes never changes.
+        dist = np.zeros(total + 1)
+        dist[run["init_mailly"]] = 1.0
+        unmet_mailly = unmet_moulin = 0.0
+        for _ in range(run["steps"]):
+            unmet_mailly += p1 * dist[0]
+            after1 = (1 - p1) * dist
+            after1[:-1] += p1 * dist[1:]
+            after1[0] += p1 * dist[0]
+            unmet_moulin += p2 * after1[total]
+            dist = (1 - p2) * after1
+            dist[1:] += p2 * after1[:-1]
+            dist[total] += p2 * after1[total]
+        mailly = float(np.dot(np.arange(total + 1), dist))
+        results.append(
+            _final_metrics(mailly, total - mailly, unmet_mailly, unmet_moulin)
+        )
+    return results
+
+
+ENGINES: Dict[str, Engine] = {
+    "reference": reference,
+    "batched": batched,
+    "event": event_driven,
+    "analytic": analytic,
+}
+
+# Engines that must reproduce the reference draw for draw.
+EXACT_ENGINES = ("reference", "batched")
@@ -0,0 +1,82 @@
+"""Plain-CSV readers and writers.
+
+Only the standard library is used so that writing one run's outputs does
+not pull pandas into every cluster task.
+"""
+
+import csv
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping
+
+PARAM_TYPES = {
+    "steps": int,
+    "p1": float,
+    "p2": float,
+    "init_mailly": int,
+    "init_moulin": int,
+    "seed": int,
+}
+
+
+def read_params(path: Path, base_seed: int = 0) -> List[Dict[str, float]]:
+    """Read a parameter grid, one dictionary per row.
+
+    Rows without a ``seed`` value get ``base_seed + row_index``.
+    """
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    params = []
+    for index, row in enumerate(rows):
+        parsed = {}
+        for name, cast in PARAM_TYPES.items():
+            value = (row.get(name) or "").strip()
+            if value:
+                parsed[name] = cast(value)
+            elif name != "seed":
+                raise ValueError(f"{path}: row {index} is missing '{name}'")
+        parsed.setdefault("seed", base_seed + index)
+        params.append(parsed)
+    return params
+
+
+def write_columns(path: Path, columns: Mapping[str, List]) -> None:
+    """Write a column dictionary (as returned by ``run_simulation``) to CSV."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns.keys())
+        writer.writerows(zip(*columns.values()))
+
+
+def read_columns(path: Path) -> Dict[str, List[str]]:
+    """Read a CSV file back into a column dictionary of strings."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        values = list(zip(*reader)) or [()] * len(header)
+    return {name: list(column) for name, column in zip(header, values)}
+
+
+def write_rows(path: Path, rows: Iterable[Mapping]) -> None:
+    """Write a list of records to CSV; the header is the union of their keys."""
+    rows = list(rows)
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with open(path, "w", newline="") as f:
+        if not rows:
+            return
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_rows(path: Path) -> List[Dict[str, str]]:
+    """Read a CSV file into a list of records."""
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def write_key_values(path: Path, values: Mapping) -> None:
+    """Write a mapping as tab-separated ``key<TAB>value`` lines."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, delimiter="\t")
+        writer.writerows(values.items())
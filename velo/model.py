@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import numpy as np
+
+
+@dataclass
+class State:
+    """Represents the state of bikes at two stations.
+
+    Attributes:
+        mailly: Number of bikes at Mailly station
+        moulin: Number of bikes at Moulin station
+        unmet_mailly: Number of unmet requests at Mailly
+        unmet_moulin: Number of unmet requests at Moulin
+    """
+
+    mailly: int
+    moulin: int
+    unmet_mailly: int = 0
+    unmet_moulin: int = 0
+
+
+def step(
+    state: State,
+    p1: float,
+    p2: float,
+    rng: np.random.Generator,
+    metrics: Dict[str, int],
+) -> State:
+    """Simulate one time step of the bike-sharing system.
+
+    Two uniform draws are consumed every step, in this order: one for a
+    Mailly -> Moulin request, then one for a Moulin -> Mailly request.
+
+    Args:
+        state: Current state of the system (bike counts at each station)
+        p1: Probability of a user wanting to go from Mailly to Moulin
+        p2: Probability of a user wanting to go from Moulin to Mailly
+        rng: Random number generator for stochastic events
+        metrics: Dictionary to track simulation metrics (unmet demand, etc.)
+
+    Returns:
+        Updated state after one simulation step
+    """
+    if rng.random() < p1:
+        if state.mailly > 0:
+            state.mailly -= 1
+            state.moulin += 1
+        else:
+            state.unmet_mailly += 1
+            metrics["unmet_mailly"] += 1
+
+    if rng.random() < p2:
+        if state.moulin > 0:
+            state.moulin -= 1
+            state.mailly += 1
+        else:
+            state.unmet_moulin += 1
+            metrics["unmet_moulin"] += 1
+
+    return state
+
+
+def run_simulation(
+    initial_mailly: int,
+    initial_moulin: int,
+    steps: int,
+    p1: float,
+    p2: float,
+    seed: int,
+) -> Tuple[Dict[str, List[int]], Dict[str, int]]:
+    """Run a complete bike-sharing simulation.
+
+    Args:
+        initial_mailly: Initial number of bikes at Mailly station
+        initial_moulin: Initial number of bikes at Moulin station
+        steps: Number of simulation steps to run
+        p1: Probability of movement from Mailly to Moulin
+        p2: Probability of movement from Moulin to Mailly
+        seed: Random seed for reproducibility
+
+    Returns:
+        Tuple containing:
+        - Column dictionary with keys 'time', 'mailly', 'moulin',
+          'unmet_mailly' and 'unmet_moulin' (cumulative), one entry per
+          step plus the initial state at time 0. It can be passed
+          directly to ``pandas.DataFrame``.
+        - Dictionary with final metrics: 'mailly', 'moulin',
+          'unmet_mailly', 'unmet_moulin' and 'final_imbalance'
+          (mailly - moulin).
+    """
+    rng = np.random.default_rng(seed)
+    state = State(mailly=initial_mailly, moulin=initial_moulin)
+    metrics = {"unmet_mailly": 0, "unmet_moulin": 0}
+
+    timeseries: Dict[str, List[int]] = {
+        "time": [0],
+        "mailly": [state.mailly],
+        "moulin": [state.moulin],
+        "unmet_mailly": [0],
+        "unmet_moulin": [0],
+    }
+    for t in range(1, steps + 1):
+        step(state, p1, p2, rng, metrics)
+        timeseries["time"].append(t)
+        timeseries["mailly"].append(state.mailly)
+        timeseries["moulin"].append(state.moulin)
+        timeseries["unmet_mailly"].append(state.unmet_mailly)
+        timeseries["unmet_moulin"].append(state.unmet_moulin)
+
+    return timeseries, {
+        "mailly": state.mailly,
+        "moulin": state.moulin,
+        "unmet_mailly": metrics["unmet_mailly"],
+        "unmet_moulin": metrics["unmet_moulin"],
+        "final_imbalance": state.mailly - state.moulin,
+    }
@@ -0,0 +1,62 @@
+"""Plotting helpers.
+
+This is the only module that imports matplotlib; the commands import it
+only when ``--plot`` is given.
+"""
+
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+
+def smooth(values: Sequence[float], window: int) -> np.ndarray:
+    """Centered moving average; ``window <= 1`` returns the values unchanged."""
+    values = np.asarray(values, dtype=float)
+    if window <= 1 or len(values) < window:
+        return values
+    kernel = np.ones(window) / window
+    return np.convolve(values, kernel, mode="same")
+
+
+def plot_timeseries(columns: Mapping[str, Sequence], path: Path) -> None:
+    """Plot bike counts at both stations for a single run."""
+    time = np.asarray(columns["time"], dtype=float)
+    fig, ax = plt.subplots(figsize=(10, 4))
+    ax.plot(time, np.asarray(columns["mailly"], dtype=float), label="Mailly")
+    ax.plot(time, np.asarray(columns["moulin"], dtype=float), label="Moulin")
+    ax.set_xlabel("time")
+    ax.set_ylabel("bikes")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def plot_runs(
+    runs: Mapping[int, Mapping[str, Sequence]],
+    path: Path,
+    smooth_window: int = 1,
+) -> None:
+    """Plot Mailly, Moulin and the imbalance of every run in three panels."""
+    fig, axes = plt.subplots(3, 1, figsize=(10, 9), sharex=True)
+    for run_id, columns in sorted(runs.items()):
+        time = np.asarray(columns["time"], dtype=float)
+        mailly = np.asarray(columns["mailly"], dtype=float)
+        moulin = np.asarray(columns["moulin"], dtype=float)
+        label = f"run {run_id}"
+        axes[0].plot(time, smooth(mailly, smooth_window), label=label)
+        axes[1].plot(time, smooth(moulin, smooth_window), label=label)
+        axes[2].plot(time, smooth(mailly - moulin, smooth_window), label=label)
+    for ax, title in zip(axes, ("Mailly", "Moulin", "Imbalance (mailly - moulin)")):
+        ax.set_title(title)
+        ax.set_ylabel("bikes")
+    axes[-1].set_xlabel("time")
+    axes[0].legend(loc="upper right", fontsize="small")
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
@@ -0,0 +1,266 @@
+"""Shared pieces of the parameter-sweep commands.
+
+The serial, thread, process and MPI runners only differ in how they map
+``simulate`` over the parameter grid; reading the grid, writing per-run
+outputs and aggregating ``metrics.csv`` live here.
+
+``run_sweep`` writes each result in the consuming thread as it arrives.
+``run_pipelined`` hands results to a dedicated writer thread through a
+bounded queue instead, so that simulations keep running during disk
+writes. At most ``max_pending`` runs may be simulated but not yet
+written; the mapper is not fed another run until the writer catches up.
+"""
+
+import argparse
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from velo.io import read_params, write_columns, write_rows
+from velo.model import run_simulation
+
+Run = Dict[str, float]
+Result = Tuple[Run, Dict[str, List[int]], Dict[str, int]]
+Writer = Callable[[Path, Result], Dict[str, float]]
+
+
+def add_sweep_arguments(
+    parser: argparse.ArgumentParser, workers: bool = True, pipeline: bool = False
+) -> None:
+    """Arguments shared by every sweep command."""
+    parser.add_argument(
+        "--params",
+        type=Path,
+        required=True,
+        help="CSV file with one parameter set per row",
+    )
+    parser.add_argument("--out-dir", type=Path, required=True, help="Output directory")
+    if workers:
+        parser.add_argument(
+            "--workers",
+            type=worker_count,
+            default="auto",
+            help="Number of workers, or 'auto' for one per CPU",
+        )
+    parser.add_argument(
+        "--plot", action="store_true", help="Plot all runs after the sweep"
+    )
+    parser.add_argument(
+        "--smooth-window",
+        type=int,
+        default=1,
+        help="Moving-average window for plots (default: 1, no smoothing)",
+    )
+    if pipeline:
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="Write outputs on a separate thread while simulations run",
+        )
+        parser.add_argument(
+            "--max-pending",
+            type=positive_int,
+            default=None,
+            help=(
+                "With --pipeline, most runs simulated but not yet written"
+                " (default: 2 per worker)"
+            ),
+        )
+
+
+def positive_int(value: str) -> int:
+    """``argparse`` type for options that must be at least 1."""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return count
+
+
+def pipeline_depth(args: argparse.Namespace, workers: int) -> Optional[int]:
+    """``max_pending`` for ``run_pipelined``, or ``None`` without ``--pipeline``."""
+    if not args.pipeline:
+        if args.max_pending is not None:
+            raise SystemExit("--max-pending only applies with --pipeline")
+        return None
+    return 2 * workers if args.max_pending is None else args.max_pending
+
+
+def worker_count(value: str) -> Union[str, int]:
+    """``argparse`` type for ``--workers``: ``'auto'`` or a positive integer."""
+    if value == "auto":
+        return value
+    try:
+        return positive_int(value)
+    except (ValueError, argparse.ArgumentTypeError):
+        raise argparse.ArgumentTypeError(
+            f"must be 'auto' or an integer >= 1, got {value}"
+        ) from None
+
+
+def resolve_workers(workers: Union[str, int]) -> int:
+    """Turn the ``--workers`` value into a positive worker count."""
+    if workers == "auto":
+        return os.cpu_count() or 1
+    return workers
+
+
+def load_runs(params_path: Path) -> List[Run]:
+    """Read the parameter grid and tag every row with its ``run_id``."""
+    runs = read_params(params_path)
+    for run_id, run in enumerate(runs):
+        run["run_id"] = run_id
+    return runs
+
+
+def simulate(run: Run) -> Result:
+    """Run the simulation for one parameter set.
+
+    Module-level so that it can be pickled by process pools.
+    """
+    timeseries, metrics = run_simulation(
+        initial_mailly=run["init_mailly"],
+        initial_moulin=run["init_moulin"],
+        steps=run["steps"],
+        p1=run["p1"],
+        p2=run["p2"],
+        seed=run["seed"],
+    )
+    return run, timeseries, metrics
+
+
+def timeseries_path(out_dir: Path, run_id: int) -> Path:
+    return out_dir / f"timeseries_{run_id}.csv"
+
+
+def metrics_row(run: Run, metrics: Mapping[str, int]) -> Dict[str, float]:
+    """One ``metrics.csv`` row: run id, its parameters, then its metrics."""
+    row = {"run_id": run["run_id"]}
+    row.update((k, v) for k, v in run.items() if k != "run_id")
+    row.update(metrics)
+    return row
+
+
+def write_run(out_dir: Path, result: Result) -> Dict[str, float]:
+    """Write one run's timeseries and return its ``metrics.csv`` row."""
+    run, timeseries, metrics = result
+    write_columns(timeseries_path(out_dir, run["run_id"]), timeseries)
+    return metrics_row(run, metrics)
+
+
+def finish(
+    out_dir: Path,
+    rows: List[Dict[str, float]],
+    plot: bool = False,
+    smooth_window: int = 1,
+    timeseries: Optional[Mapping[int, Mapping[str, List[int]]]] = None,
+) -> Path:
+    """Write the aggregated ``metrics.csv`` and, if requested, the plot."""
+    rows = sorted(rows, key=lambda row: row["run_id"])
+    metrics_path = out_dir / "metrics.csv"
+    write_rows(metrics_path, rows)
+    if plot:
+        from velo.plotting import plot_runs
+
+        plot_runs(timeseries or {}, out_dir / "metrics_3plot.png", smooth_window)
+    print(f"Wrote {len(rows)} runs to {metrics_path}")
+    return metrics_path
+
+
+def run_sweep(args: argparse.Namespace, mapper) -> Path:
+    """Drive a sweep with ``mapper(simulate, runs)`` yielding results in any order."""
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    runs = load_runs(args.params)
+    rows = []
+    kept = {}
+    for result in mapper(simulate, runs):
+        rows.append(write_run(args.out_dir, result))
+        if args.plot:
+            kept[result[0]["run_id"]] = result[1]
+    return finish(args.out_dir, rows, args.plot, args.smooth_window, kept)
+
+
+def _write_results(
+    out_dir: Path,
+    results: "queue.Queue[Optional[Result]]",
+    pending: threading.Semaphore,
+    rows: List[Dict[str, float]],
+    kept: Optional[Dict[int, Dict[str, List[int]]]],
+    errors: List[BaseException],
+    write: Writer,
+) -> None:
+    """Writer thread: persist results and fold their metrics until ``None`` arrives.
+
+    After a failure the queue is still drained, so that producers blocked
+    on ``pending`` can finish and the error can be raised by the caller.
+    """
+    while True:
+        result = results.get()
+        if result is None:
+            return
+        try:
+            if not errors:
+                rows.append(write(out_dir, result))
+                if kept is not None:
+                    kept[result[0]["run_id"]] = result[1]
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            pending.release()
+
+
+def run_pipelined(
+    args: argparse.Namespace,
+    mapper,
+    max_pending: int,
+    write: Writer = write_run,
+) -> Path:
+    """Like ``run_sweep``, but overlap simulation with writing outputs.
+
+    ``write`` persists one result and returns its ``metrics.csv`` row; it
+    runs on the writer thread.
+
+    ``mapper`` must pull runs lazily from its iterable (``map``,
+    ``Pool.imap_unordered``); one that submits everything up front, such as
+    ``Executor.map``, would block on the first run over ``max_pending``.
+    """
+    if max_pending < 1:
+        raise ValueError(f"--max-pending must be >= 1, got {max_pending}")
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    runs = load_runs(args.params)
+
+    pending = threading.Semaphore(max_pending)
+    results: "queue.Queue[Optional[Result]]" = queue.Queue(maxsize=max_pending)
+    rows: List[Dict[str, float]] = []
+    kept = {} if args.plot else None
+    errors: List[BaseException] = []
+    writer = threading.Thread(
+        target=_write_results,
+        args=(args.out_dir, results, pending, rows, kept, errors, write),
+        name="velo-writer",
+        daemon=True,
+    )
+    writer.start()
+
+    stopped = threading.Event()
+
+    def throttled():
+        for run in runs:
+            pending.acquire()
+            if stopped.is_set() or errors:
+                return
+            yield run
+
+    try:
+        for result in mapper(simulate, throttled()):
+            results.put(result)
+    finally:
+        # Wake a feeder still blocked on ``pending`` if the loop failed.
+        stopped.set()
+        pending.release()
+        results.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return finish(args.out_dir, rows, args.plot, args.smooth_window, kept)